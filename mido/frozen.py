@@ -11,7 +11,9 @@ class Frozen:
         raise ValueError('frozen message is immutable')
 
     def __hash__(self):
-        return hash(tuple(sorted(vars(self).items())))
+        # A frozenset doesn't care about attribute order so there's no
+        # need to sort the items.
+        return hash(frozenset(vars(self).items()))
 
 
 class FrozenMessage(Frozen, Message):
@@ -10,8 +10,15 @@ from .specs import (
     MIN_PITCHWHEEL,
     MIN_SONGPOS,
     SPEC_BY_TYPE,
+    SPECS,
 )
 
+# Listing the built-in types first lets isinstance() return early
+# for them instead of going through the slower abstract base class
+# check, which is still needed for things like numpy integers.
+INTEGRAL_TYPES = (int, Integral)
+REAL_TYPES = (int, float, Real)
+
 
 def check_type(type_):
     if type_ not in SPEC_BY_TYPE:
@@ -19,14 +26,14 @@ def check_type(type_):
 
 
 def check_channel(channel):
-    if not isinstance(channel, Integral):
+    if not isinstance(channel, INTEGRAL_TYPES):
         raise TypeError('channel must be int')
     elif not 0 <= channel <= 15:
         raise ValueError('channel must be in range 0..15')
 
 
 def check_pos(pos):
-    if not isinstance(pos, Integral):
+    if not isinstance(pos, INTEGRAL_TYPES):
         raise TypeError('song pos must be int')
     elif not MIN_SONGPOS <= pos <= MAX_SONGPOS:
         raise ValueError('song pos must be in range {}..{}'.format(
@@ -34,7 +41,7 @@ def check_pos(pos):
 
 
 def check_pitch(pitch):
-    if not isinstance(pitch, Integral):
+    if not isinstance(pitch, INTEGRAL_TYPES):
         raise TypeError('pichwheel value must be int')
     elif not MIN_PITCHWHEEL <= pitch <= MAX_PITCHWHEEL:
         raise ValueError('pitchwheel value must be in range {}..{}'.format(
@@ -42,33 +49,39 @@ def check_pitch(pitch):
 
 
 def check_data(data_bytes):
-    for byte in data_bytes:
-        check_data_byte(byte)
+    if isinstance(data_bytes, (bytes, bytearray)):
+        # These can only hold ints in range 0..255 so we only need to
+        # check the upper bound, which max() does without a Python loop.
+        if data_bytes and max(data_bytes) > 127:
+            raise ValueError('data byte must be in range 0..127')
+    else:
+        for byte in data_bytes:
+            check_data_byte(byte)
 
 
 def check_frame_type(value):
-    if not isinstance(value, Integral):
+    if not isinstance(value, INTEGRAL_TYPES):
         raise TypeError('frame_type must be int')
     elif not 0 <= value <= 7:
         raise ValueError('frame_type must be in range 0..7')
 
 
 def check_frame_value(value):
-    if not isinstance(value, Integral):
+    if not isinstance(value, INTEGRAL_TYPES):
         raise TypeError('frame_value must be int')
     elif not 0 <= value <= 15:
         raise ValueError('frame_value must be in range 0..15')
 
 
 def check_data_byte(value):
-    if not isinstance(value, Integral):
+    if not isinstance(value, INTEGRAL_TYPES):
         raise TypeError('data byte must be int')
     elif not 0 <= value <= 127:
         raise ValueError('data byte must be in range 0..127')
 
 
 def check_time(time):
-    if not isinstance(time, Real):
+    if not isinstance(time, REAL_TYPES):
         raise TypeError('time must be int or float')
 
 
@@ -90,18 +103,26 @@ _CHECKS = {
 }
 
 
-def check_value(name, value):
-    _CHECKS[name](value)
+def _make_spec_checks(specs):
+    # Maps each message type to a dictionary of checks for the
+    # attributes of that type.
+    return {spec['type']: {name: _CHECKS[name]
+                           for name in spec['attribute_names']}
+            for spec in specs}
+
+
+CHECKS_BY_TYPE = _make_spec_checks(SPECS)
 
 
 def check_msgdict(msgdict):
-    spec = SPEC_BY_TYPE.get(msgdict['type'])
-    if spec is None:
+    checks = CHECKS_BY_TYPE.get(msgdict['type'])
+    if checks is None:
         raise ValueError('unknown message type {!r}'.format(msgdict['type']))
 
     for name, value in msgdict.items():
-        if name not in spec['attribute_names']:
+        check = checks.get(name)
+        if check is None:
             raise ValueError(
-                '{} message has no attribute {}'.format(spec['type'], name))
+                '{} message has no attribute {}'.format(msgdict['type'], name))
 
-        check_value(name, value)
+        check(value)
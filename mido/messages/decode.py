@@ -5,62 +5,104 @@
 from .checks import check_data
 from .specs import (
     CHANNEL_MESSAGES,
-    MIN_PITCHWHEEL,
-    SPEC_BY_STATUS,
+    SPEC_TABLE,
+    SPECS,
     SYSEX_END,
     SYSEX_START,
 )
 
 
-def _decode_sysex_data(data):
+def _decode_sysex_data(status_byte, data):
     return {'data': tuple(data)}
 
 
-def _decode_quarter_frame_data(data):
+def _decode_quarter_frame_data(status_byte, data):
     return {'frame_type': data[0] >> 4,
             'frame_value': data[0] & 15}
 
 
-def _decode_songpos_data(data):
+def _decode_songpos_data(status_byte, data):
     return {'pos': data[0] | (data[1] << 7)}
 
 
-def _decode_pitchwheel_data(data):
-    return {'pitch': data[0] | ((data[1] << 7) + MIN_PITCHWHEEL)}
+def _decode_song_select_data(status_byte, data):
+    return {'song': data[0]}
 
 
-def _make_special_cases():
-    cases = {
-        0xe0: _decode_pitchwheel_data,
-        0xf0: _decode_sysex_data,
-        0xf1: _decode_quarter_frame_data,
-        0xf2: _decode_songpos_data,
-    }
+# Channel is stored in the lower nibble of the status byte.
 
-    for i in range(16):
-        cases[0xe0 | i] = _decode_pitchwheel_data
+def _decode_note_data(status_byte, data):
+    return {'channel': status_byte & 0x0f,
+            'note': data[0],
+            'velocity': data[1]}
 
-    return cases
 
+def _decode_polytouch_data(status_byte, data):
+    return {'channel': status_byte & 0x0f,
+            'note': data[0],
+            'value': data[1]}
 
-_SPECIAL_CASES = _make_special_cases()
 
+def _decode_control_change_data(status_byte, data):
+    return {'channel': status_byte & 0x0f,
+            'control': data[0],
+            'value': data[1]}
 
-def _decode_data_bytes(status_byte, data, spec):
-    # Subtract 1 for status byte.
-    if len(data) != (spec['length'] - 1):
-        raise ValueError(
-            'wrong number of bytes for {} message'.format(spec['type']))
 
-    # TODO: better name than args?
-    names = [name for name in spec['value_names'] if name != 'channel']
-    args = {name: value for name, value in zip(names, data)}
+def _decode_program_change_data(status_byte, data):
+    return {'channel': status_byte & 0x0f,
+            'program': data[0]}
+
+
+def _decode_aftertouch_data(status_byte, data):
+    return {'channel': status_byte & 0x0f,
+            'value': data[0]}
+
+
+def _decode_pitchwheel_data(status_byte, data):
+    # Shift 0..16383 back into the signed range (+ MIN_PITCHWHEEL).
+    return {'channel': status_byte & 0x0f,
+            'pitch': (data[0] | (data[1] << 7)) - 8192}
+
+
+_SPECIAL_CASES = {
+    'pitchwheel': _decode_pitchwheel_data,
+    'sysex': _decode_sysex_data,
+    'quarter_frame': _decode_quarter_frame_data,
+    'songpos': _decode_songpos_data,
+    'song_select': _decode_song_select_data,
+
+    'note_off': _decode_note_data,
+    'note_on': _decode_note_data,
+    'polytouch': _decode_polytouch_data,
+    'control_change': _decode_control_change_data,
+    'program_change': _decode_program_change_data,
+    'aftertouch': _decode_aftertouch_data,
+}
+
+
+def _decode_no_data(status_byte, data):
+    return {}
+
+
+def _make_decoders(specs):
+    # Decoders indexed by status byte. Messages without a special case
+    # have no data bytes.
+    decoders = [None] * 256
+
+    for spec in specs:
+        decode = _SPECIAL_CASES.get(spec['type'], _decode_no_data)
+
+        if spec['status_byte'] in CHANNEL_MESSAGES:
+            for channel in range(16):
+                decoders[spec['status_byte'] | channel] = decode
+        else:
+            decoders[spec['status_byte']] = decode
 
-    if status_byte in CHANNEL_MESSAGES:
-        # Channel is stored in the lower nibble of the status byte.
-        args['channel'] = status_byte & 0x0f
+    return decoders
 
-    return args
+
+_DECODERS = _make_decoders(SPECS)
 
 
 def decode_message(msg_bytes, time=0, check=True):
@@ -71,8 +113,6 @@ def decode_message(msg_bytes, time=0, check=True):
 
     This is not a part of the public API.
     """
-    # TODO: this function is getting long.
-
     if len(msg_bytes) == 0:
         raise ValueError('message is 0 bytes long')
 
@@ -80,16 +120,17 @@ def decode_message(msg_bytes, time=0, check=True):
     data = msg_bytes[1:]
 
     try:
-        spec = SPEC_BY_STATUS[status_byte]
-    except KeyError as ke:
-        raise ValueError(f'invalid status byte {status_byte!r}') from ke
+        if 0 <= status_byte <= 0xff:
+            spec = SPEC_TABLE[status_byte]
+        else:
+            spec = None
+    except TypeError:
+        # Not an integer.
+        spec = None
 
-    msg = {
-        'type': spec['type'],
-        'time': time,
-    }
+    if spec is None:
+        raise ValueError(f'invalid status byte {status_byte!r}')
 
-    # Sysex.
     if status_byte == SYSEX_START:
         if len(data) < 1:
             raise ValueError('sysex without end byte')
@@ -99,15 +140,24 @@ def decode_message(msg_bytes, time=0, check=True):
         if end != SYSEX_END:
             raise ValueError(f'invalid sysex end byte {end!r}')
 
+        if check and not isinstance(data, (bytes, bytearray)):
+            # Ports and the parser hand us lists of ints. Converting to
+            # bytes lets check_data() take its fast path, and bytes()
+            # itself rejects values outside 0..255.
+            data = bytes(data)
+
+    # Subtract 1 for status byte.
+    elif len(data) != (spec['length'] - 1):
+        raise ValueError(
+            'wrong number of bytes for {} message'.format(spec['type']))
+
     if check:
         check_data(data)
 
-    if status_byte in _SPECIAL_CASES:
-        if status_byte in CHANNEL_MESSAGES:
-            msg['channel'] = status_byte & 0x0f
-
-        msg.update(_SPECIAL_CASES[status_byte](data))
-    else:
-        msg.update(_decode_data_bytes(status_byte, data, spec))
+    msg = {
+        'type': spec['type'],
+        'time': time,
+    }
+    msg.update(_DECODERS[status_byte](status_byte, data))
 
     return msg
@@ -2,16 +2,17 @@
 #
 # SPDX-License-Identifier: MIT
 
-from .specs import CHANNEL_MESSAGES, MIN_PITCHWHEEL, SPEC_BY_TYPE
+from .specs import SPECS
 
 
 def _encode_pitchwheel(msg):
-    pitch = msg['pitch'] - MIN_PITCHWHEEL
+    # Shift the signed 14 bit value into 0..16383 (- MIN_PITCHWHEEL).
+    pitch = msg['pitch'] + 8192
     return [0xe0 | msg['channel'], pitch & 0x7f, pitch >> 7]
 
 
 def _encode_sysex(msg):
-    return [0xf0] + list(msg['data']) + [0xf7]
+    return [0xf0, *msg['data'], 0xf7]
 
 
 def _encode_quarter_frame(msg):
@@ -23,6 +24,10 @@ def _encode_songpos(data):
     return [0xf2, pos & 0x7f, pos >> 7]
 
 
+def _encode_song_select(msg):
+    return [0xf3, msg['song']]
+
+
 def _encode_note_off(msg):
     return [0x80 | msg['channel'], msg['note'], msg['velocity']]
 
@@ -31,23 +36,63 @@ def _encode_note_on(msg):
     return [0x90 | msg['channel'], msg['note'], msg['velocity']]
 
 
+def _encode_polytouch(msg):
+    return [0xa0 | msg['channel'], msg['note'], msg['value']]
+
+
 def _encode_control_change(msg):
     return [0xb0 | msg['channel'], msg['control'], msg['value']]
 
 
+def _encode_program_change(msg):
+    return [0xc0 | msg['channel'], msg['program']]
+
+
+def _encode_aftertouch(msg):
+    return [0xd0 | msg['channel'], msg['value']]
+
+
 _SPECIAL_CASES = {
     'pitchwheel': _encode_pitchwheel,
     'sysex': _encode_sysex,
     'quarter_frame': _encode_quarter_frame,
     'songpos': _encode_songpos,
+    'song_select': _encode_song_select,
 
-    # These are so common that they get special cases to speed things up.
     'note_off': _encode_note_off,
     'note_on': _encode_note_on,
+    'polytouch': _encode_polytouch,
     'control_change': _encode_control_change,
+    'program_change': _encode_program_change,
+    'aftertouch': _encode_aftertouch,
 }
 
 
+def _make_status_only_encoder(status_byte):
+    def encode(msg):
+        return [status_byte]
+
+    return encode
+
+
+def _make_encoders(specs):
+    # Messages without a special case have no data bytes and encode to
+    # just the status byte.
+    encoders = {}
+
+    for spec in specs:
+        type_ = spec['type']
+        if type_ in _SPECIAL_CASES:
+            encoders[type_] = _SPECIAL_CASES[type_]
+        else:
+            encoders[type_] = _make_status_only_encoder(spec['status_byte'])
+
+    return encoders
+
+
+_ENCODERS = _make_encoders(SPECS)
+
+
 def encode_message(msg):
     """Encode msg dict as a list of bytes.
 
@@ -56,17 +101,4 @@ def encode_message(msg):
 
     This is not a part of the public API.
     """
-
-    encode = _SPECIAL_CASES.get(msg['type'])
-    if encode:
-        return encode(msg)
-    else:
-        spec = SPEC_BY_TYPE[msg['type']]
-        status_byte = spec['status_byte']
-
-        if status_byte in CHANNEL_MESSAGES:
-            status_byte |= msg['channel']
-
-        data = [msg[name] for name in spec['value_names'] if name != 'channel']
-
-        return [status_byte] + data
+    return _ENCODERS[msg['type']](msg)
@@ -4,12 +4,17 @@
 
 import re
 
-from .checks import check_data, check_msgdict, check_value
+from .checks import CHECKS_BY_TYPE, check_data, check_msgdict
 from .decode import decode_message
 from .encode import encode_message
-from .specs import REALTIME_TYPES, SPEC_BY_TYPE, make_msgdict
+from .specs import REALTIME_TYPES, SPEC_BY_TYPE, SPECS, make_msgdict
 from .strings import msg2str, str2msg
 
+# Two digit hex strings for all byte values, used by BaseMessage.hex().
+# (bytes.hex() can't be used since it only takes a separator in Python
+# 3.8 and later and then only a single character.)
+_HEX_BYTES = [f'{byte:02X}' for byte in range(256)]
+
 
 class BaseMessage:
     """Abstract base class for messages."""
@@ -33,7 +38,7 @@ class BaseMessage:
 
         Each number is separated by the string sep.
         """
-        return sep.join(f'{byte:02X}' for byte in self.bytes())
+        return sep.join(map(_HEX_BYTES.__getitem__, self.bin()))
 
     def dict(self):
         """Returns a dictionary containing the attributes of the message.
@@ -59,8 +64,9 @@ class BaseMessage:
         return cls(**data)
 
     def _get_value_names(self):
-        # This is overridden by MetaMessage.
-        return list(SPEC_BY_TYPE[self.type]['value_names']) + ['time']
+        # Used by __repr__(). Message has its own __repr__() so this
+        # is only implemented by MetaMessage.
+        raise NotImplementedError
 
     def __repr__(self):
         items = [repr(self.type)]
@@ -110,15 +116,39 @@ class SysexData(tuple):
         return self + SysexData(other)
 
 
+def _make_repr_formats(specs):
+    # The class name is filled in when formatting since it can be a
+    # subclass like FrozenMessage.
+    formats = {}
+
+    for spec in specs:
+        args = [repr(spec['type'])]
+        for name in spec['value_names'] + ('time',):
+            args.append(f'{name}={{{name}!r}}')
+        formats[spec['type']] = '{}(' + ', '.join(args) + ')'
+
+    return formats
+
+
+_REPR_FORMATS = _make_repr_formats(SPECS)
+
+
 class Message(BaseMessage):
     def __init__(self, type, skip_checks=False, **args):
         msgdict = make_msgdict(type, args)
-        if type == 'sysex':
+        if type == 'sysex' and not isinstance(msgdict['data'],
+                                              (bytes, bytearray)):
+            # Data can be an iterator so it has to be converted before
+            # it's checked. Buffers are checked as they are so that
+            # check_data() can take its fast path.
             msgdict['data'] = SysexData(msgdict['data'])
 
         if not skip_checks:
             check_msgdict(msgdict)
 
+        if type == 'sysex' and not isinstance(msgdict['data'], SysexData):
+            msgdict['data'] = SysexData(msgdict['data'])
+
         vars(self).update(msgdict)
 
     def copy(self, skip_checks=False, **overrides):
@@ -149,7 +179,8 @@ class Message(BaseMessage):
         if not skip_checks:
             check_msgdict(msgdict)
 
-        return self.__class__(skip_checks=skip_checks, **msgdict)
+        # Already checked above so there's no need to check again.
+        return self.__class__(skip_checks=True, **msgdict)
 
     @classmethod
     def from_bytes(cl, data, time=0):
@@ -201,15 +232,21 @@ class Message(BaseMessage):
     def __str__(self):
         return msg2str(vars(self))
 
+    def __repr__(self):
+        return _REPR_FORMATS[self.type].format(type(self).__name__,
+                                               **vars(self))
+
     def _setattr(self, name, value):
-        if name == 'type':
-            raise AttributeError('type attribute is read only')
-        elif name not in vars(self):
+        # The checks double as the set of valid attribute names.
+        check = CHECKS_BY_TYPE[self.type].get(name)
+        if check is None:
             raise AttributeError('{} message has no '
                                  'attribute {}'.format(self.type,
                                                        name))
+        elif name == 'type':
+            raise AttributeError('type attribute is read only')
         else:
-            check_value(name, value)
+            check(value)
             if name == 'data':
                 vars(self)['data'] = SysexData(value)
             else:
@@ -221,6 +258,22 @@ class Message(BaseMessage):
         """Encode message and return as a list of integers."""
         return encode_message(vars(self))
 
+    def bin(self):
+        """Encode message and return as a bytearray.
+
+        This can be used to write the message to a file.
+        """
+        if self.type == 'sysex':
+            # Copy the data straight into the bytearray instead of
+            # going through a list of integers.
+            data = bytearray(len(self.data) + 2)
+            data[0] = 0xf0
+            data[1:-1] = self.data
+            data[-1] = 0xf7
+            return data
+        else:
+            return bytearray(encode_message(vars(self)))
+
 
 def parse_string(text):
     """Parse a string of text and return a message.
@@ -246,7 +299,8 @@ def parse_string_stream(stream):
     line_number = 1
     for line in stream:
         try:
-            line = line.split('#')[0].strip()
+            # partition() doesn't split the rest of the line on '#'.
+            line = line.partition('#')[0].strip()
             if line:
                 yield parse_string(line), None
         except ValueError as exception:
@@ -31,7 +31,7 @@ def _defmsg(status_byte, type_, value_names, length):
         'status_byte': status_byte,
         'type': type_,
         'value_names': value_names,
-        'attribute_names': set(value_names) | {'type', 'time'},
+        'attribute_names': frozenset(value_names) | {'type', 'time'},
         'length': length,
     }
 
@@ -68,6 +68,10 @@ def _make_spec_lookups(specs):
     lookup = {}
     by_status = {}
     by_type = {}
+    # Same as by_status but as a list indexed by status byte, with
+    # None for undefined status bytes. This saves a dictionary lookup
+    # when decoding messages.
+    table = [None] * 256
 
     for spec in specs:
         type_ = spec['type']
@@ -78,16 +82,21 @@ def _make_spec_lookups(specs):
         if status_byte in CHANNEL_MESSAGES:
             for channel in range(16):
                 by_status[status_byte | channel] = spec
+                table[status_byte | channel] = spec
         else:
             by_status[status_byte] = spec
+            table[status_byte] = spec
 
     lookup.update(by_status)
     lookup.update(by_type)
 
-    return lookup, by_status, by_type
+    return lookup, by_status, by_type, table
 
 
-SPEC_LOOKUP, SPEC_BY_STATUS, SPEC_BY_TYPE = _make_spec_lookups(SPECS)
+(SPEC_LOOKUP,
+ SPEC_BY_STATUS,
+ SPEC_BY_TYPE,
+ SPEC_TABLE) = _make_spec_lookups(SPECS)
 
 REALTIME_TYPES = {'tune_request', 'clock', 'start', 'continue', 'stop'}
 
@@ -109,6 +118,24 @@ DEFAULT_VALUES = {
 }
 
 
+def _make_default_msgdicts(specs):
+    msgdicts = {}
+
+    for spec in specs:
+        msg = {'type': spec['type'], 'time': DEFAULT_VALUES['time']}
+        for name in spec['value_names']:
+            msg[name] = DEFAULT_VALUES[name]
+
+        msgdicts[spec['type']] = msg
+
+    return msgdicts
+
+
+# Default message dictionary for each message type. make_msgdict()
+# copies these instead of looking up each default value.
+_DEFAULT_MSGDICTS = _make_default_msgdicts(SPECS)
+
+
 # TODO: should this be in decode.py?
 
 def make_msgdict(type_, overrides):
@@ -121,16 +148,11 @@ def make_msgdict(type_, overrides):
     No type or value checking is done.  The caller is responsible for
     calling check_msgdict().
     """
-    if type_ in SPEC_BY_TYPE:
-        spec = SPEC_BY_TYPE[type_]
+    if type_ in _DEFAULT_MSGDICTS:
+        msg = _DEFAULT_MSGDICTS[type_].copy()
     else:
         raise LookupError(f'Unknown message type {type_!r}')
 
-    msg = {'type': type_, 'time': DEFAULT_VALUES['time']}
-
-    for name in spec['value_names']:
-        msg[name] = DEFAULT_VALUES[name]
-
     msg.update(overrides)
 
     return msg
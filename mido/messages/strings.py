@@ -2,26 +2,45 @@
 #
 # SPDX-License-Identifier: MIT
 
-from .specs import SPEC_BY_TYPE, make_msgdict
+import re
 
+from .specs import SPECS, make_msgdict
 
-def msg2str(msg, include_time=True):
-    type_ = msg['type']
-    spec = SPEC_BY_TYPE[type_]
+# Matches one name=value argument including the whitespace before it.
+_ARG_RE = re.compile(r'\s+(\w+)=(\S+)')
+
+
+def _make_str_formats(specs):
+    # Maps each message type to a (without time, with time) pair of
+    # format strings.
+    formats = {}
+
+    for spec in specs:
+        words = [spec['type']]
+        for name in spec['value_names']:
+            if name == 'data':
+                words.append('data=({data})')
+            else:
+                words.append(f'{name}={{{name}}}')
+
+        fmt = ' '.join(words)
+        formats[spec['type']] = (fmt, fmt + ' time={time}')
+
+    return formats
 
-    words = [type_]
 
-    for name in spec['value_names']:
-        value = msg[name]
+_STR_FORMATS = _make_str_formats(SPECS)
 
-        if name == 'data':
-            value = '({})'.format(','.join(str(byte) for byte in value))
-        words.append(f'{name}={value}')
 
+def msg2str(msg, include_time=True):
+    fmt, fmt_with_time = _STR_FORMATS[msg['type']]
     if include_time:
-        words.append('time={}'.format(msg['time']))
+        fmt = fmt_with_time
+
+    if 'data' in msg:
+        msg = dict(msg, data=','.join(str(byte) for byte in msg['data']))
 
-    return str.join(' ', words)
+    return fmt.format_map(msg)
 
 
 def _parse_time(value):
@@ -40,11 +59,15 @@ def _parse_time(value):
 
 
 def _parse_data(value):
-    if not value.startswith('(') and value.endswith(')'):
+    if not (value.startswith('(') and value.endswith(')')):
         raise ValueError('missing parentheses in data message')
 
+    value = value[1:-1]
+    if not value:
+        return []
+
     try:
-        return [int(byte) for byte in value[1:-1].split(',')]
+        return [int(byte) for byte in value.split(',')]
     except ValueError as ve:
         raise ValueError('unable to parse data bytes') from ve
 
@@ -55,14 +78,21 @@ def str2msg(text):
     No type or value checking is done. The caller is responsible for
     calling check_msgdict().
     """
-    words = text.split()
-    type_ = words[0]
-    args = words[1:]
+    text = text.strip()
+    if not text:
+        raise ValueError('empty message')
+
+    type_ = text.split(None, 1)[0]
+    pos = len(type_)
 
     msg = {}
 
-    for arg in args:
-        name, value = arg.split('=', 1)
+    while pos < len(text):
+        match = _ARG_RE.match(text, pos)
+        if match is None:
+            raise ValueError(f'invalid argument {text[pos:].split()[0]!r}')
+
+        name, value = match.group(1, 2)
         if name == 'time':
             value = _parse_time(value)
         elif name == 'data':
@@ -71,5 +101,6 @@ def str2msg(text):
             value = int(value)
 
         msg[name] = value
+        pos = match.end()
 
     return make_msgdict(type_, msg)
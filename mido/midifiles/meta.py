@@ -20,6 +20,7 @@ from contextlib import contextmanager
 from numbers import Integral
 
 from ..messages import BaseMessage, check_time
+from ..messages.checks import INTEGRAL_TYPES
 
 _charset = 'latin1'
 
@@ -111,23 +112,23 @@ def encode_variable_int(value):
     This is used for delta times and meta message payload
     length.
     """
-    if not isinstance(value, Integral) or value < 0:
+    if not isinstance(value, INTEGRAL_TYPES) or value < 0:
         raise ValueError('variable int must be a non-negative integer')
+    elif value < 0x80:
+        # Most delta times and lengths fit in a single byte.
+        return [value]
 
     bytes = []
     while value:
         bytes.append(value & 0x7f)
         value >>= 7
 
-    if bytes:
-        bytes.reverse()
+    bytes.reverse()
 
-        # Set high bit in every byte but the last.
-        for i in range(len(bytes) - 1):
-            bytes[i] |= 0x80
-        return bytes
-    else:
-        return [0]
+    # Set high bit in every byte but the last.
+    for i in range(len(bytes) - 1):
+        bytes[i] |= 0x80
+    return bytes
 
 
 def decode_variable_int(value):
@@ -439,7 +440,9 @@ def add_meta_spec(klass):
         spec.type = name
 
     # This is used by copy().
-    spec.settable_attributes = set(spec.attributes) | {'time'}
+    spec.settable_attributes = frozenset(spec.attributes) | {'time'}
+    # This is used by __repr__().
+    spec.value_names = tuple(spec.attributes) + ('time',)
     _META_SPECS[spec.type_byte] = spec
     _META_SPECS[spec.type] = spec
     _META_SPEC_BY_TYPE[spec.type] = spec
@@ -543,7 +546,7 @@ class MetaMessage(BaseMessage):
         spec = _META_SPEC_BY_TYPE[self.type]
         data = spec.encode(self)
 
-        return ([0xff, spec.type_byte] + encode_variable_int(len(data)) + data)
+        return [0xff, spec.type_byte, *encode_variable_int(len(data)), *data]
 
     @classmethod
     def from_bytes(cls, msg_bytes):
@@ -566,8 +569,7 @@ class MetaMessage(BaseMessage):
 
     def _get_value_names(self):
         """Used by BaseMessage.__repr__()."""
-        spec = _META_SPEC_BY_TYPE[self.type]
-        return spec.attributes + ['time']
+        return _META_SPEC_BY_TYPE[self.type].value_names
 
 
 class UnknownMetaMessage(MetaMessage):
@@ -594,4 +596,4 @@ class UnknownMetaMessage(MetaMessage):
 
     def bytes(self):
         length = encode_variable_int(len(self.data))
-        return ([0xff, self.type_byte] + length + list(self.data))
+        return [0xff, self.type_byte, *length, *self.data]
@@ -24,7 +24,8 @@ import struct
 import time
 from numbers import Integral
 
-from ..messages import SPEC_BY_STATUS, Message
+from ..messages import Message
+from ..messages.specs import SPEC_TABLE
 from .meta import MetaMessage, build_meta_message, encode_variable_int, meta_charset
 from .tracks import MidiTrack, fix_end_of_track, merge_tracks
 from .units import tick2second
@@ -53,8 +54,11 @@ class DebugFileWrapper:
     def read(self, size):
         data = self.file.read(size)
 
-        for byte in data:
-            print_byte(byte, self.file.tell())
+        # Print each byte with the position after it, as if it had been
+        # read on its own.
+        start = self.file.tell() - len(data)
+        for i, byte in enumerate(data, 1):
+            print_byte(byte, start + i)
 
         return data
 
@@ -74,7 +78,12 @@ def read_bytes(infile, size):
     if size > MAX_MESSAGE_LENGTH:
         raise OSError('Message length {} exceeds maximum length {}'.format(
             size, MAX_MESSAGE_LENGTH))
-    return [read_byte(infile) for _ in range(size)]
+
+    # Read all the bytes at once instead of one read() call per byte.
+    data = infile.read(size)
+    if len(data) < size:
+        raise EOFError
+    return data
 
 
 def _dbg(text=''):
@@ -114,14 +123,13 @@ def read_file_header(infile):
 
 
 def read_message(infile, status_byte, peek_data, delta, clip=False):
-    try:
-        spec = SPEC_BY_STATUS[status_byte]
-    except LookupError as le:
-        raise OSError(f'undefined status byte 0x{status_byte:02x}') from le
+    spec = SPEC_TABLE[status_byte]
+    if spec is None:
+        raise OSError(f'undefined status byte 0x{status_byte:02x}')
 
     # Subtract 1 for status byte.
     size = spec['length'] - 1 - len(peek_data)
-    data_bytes = peek_data + read_bytes(infile, size)
+    data_bytes = peek_data + list(read_bytes(infile, size))
 
     if clip:
         data_bytes = [byte if byte < 127 else 127 for byte in data_bytes]
@@ -145,7 +153,7 @@ def read_sysex(infile, delta, clip=False):
         data = data[:-1]
 
     if clip:
-        data = [byte if byte < 127 else 127 for byte in data]
+        data = bytes(byte if byte < 127 else 127 for byte in data)
 
     return Message('sysex', data=data, time=delta)
 
@@ -5,7 +5,7 @@
 from collections import deque
 from numbers import Integral
 
-from .messages.specs import SPEC_BY_STATUS, SYSEX_END, SYSEX_START
+from .messages.specs import SPEC_TABLE, SYSEX_END, SYSEX_START
 
 
 class Tokenizer:
@@ -37,12 +37,12 @@ class Tokenizer:
                 # messages. Reset parser.
                 self._status = 0
 
-            if status in SPEC_BY_STATUS:
+            if SPEC_TABLE[status] is not None:
                 self._messages.append([status])
 
-        elif status in SPEC_BY_STATUS:
+        elif SPEC_TABLE[status] is not None:
             # New message.
-            spec = SPEC_BY_STATUS[status]
+            spec = SPEC_TABLE[status]
 
             if spec['length'] == 1:
                 self._messages.append([status])
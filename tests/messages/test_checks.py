@@ -2,9 +2,11 @@
 #
 # SPDX-License-Identifier: MIT
 
+from fractions import Fraction
+
 from pytest import raises
 
-from mido.messages.checks import check_time
+from mido.messages.checks import check_data, check_time
 
 
 def test_check_time():
@@ -22,3 +24,27 @@ def test_check_time():
 
     with raises(TypeError):
         check_time('abc')
+
+
+def test_check_data():
+    check_data([])
+    check_data([0, 127])
+    check_data(b'')
+    check_data(b'\x00\x7f')
+    check_data(bytearray(b'\x00\x7f'))
+
+    with raises(ValueError):
+        check_data([0, 128])
+
+    with raises(ValueError):
+        check_data(b'\x00\x80')
+
+    with raises(ValueError):
+        check_data(bytearray(b'\xff'))
+
+    with raises(TypeError):
+        check_data(['abc'])
+
+
+def test_check_time_accepts_any_real():
+    check_time(Fraction(1, 3))
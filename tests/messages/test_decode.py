@@ -53,3 +53,30 @@ def test_sysex_without_stop_byte():
 
     with raises(ValueError):
         decode_message([0xf0, 0])
+
+
+def test_status_byte_out_of_range():
+    with raises(ValueError):
+        decode_message([-1, 0, 0])
+
+    with raises(ValueError):
+        decode_message([0x100, 0, 0])
+
+    with raises(ValueError):
+        decode_message('abc')
+
+
+def test_too_few_bytes_special_case():
+    with raises(ValueError):
+        decode_message(b'\xe0\x00')
+
+    with raises(ValueError):
+        decode_message(b'\xf2\x00')
+
+
+def test_sysex_data_out_of_range():
+    with raises(ValueError):
+        decode_message([0xf0, 0x80, 0xf7])
+
+    with raises(ValueError):
+        decode_message([0xf0, 0x100, 0xf7])
@@ -4,7 +4,7 @@
 
 from pytest import raises
 
-from mido.messages.messages import Message, SysexData
+from mido.messages.messages import Message, SysexData, parse_string_stream
 from mido.messages.specs import MAX_PITCHWHEEL, MAX_SONGPOS, MIN_PITCHWHEEL, MIN_SONGPOS
 
 
@@ -20,6 +20,21 @@ def test_set_type():
         Message('note_on').type = 'note_off'
 
 
+def test_set_invalid_attribute():
+    """Can't set attributes that the message type doesn't have."""
+    with raises(AttributeError):
+        Message('note_on').program = 1
+
+
+def test_set_invalid_value():
+    msg = Message('note_on')
+    with raises(ValueError):
+        msg.note = 128
+
+    with raises(TypeError):
+        msg.channel = 'abc'
+
+
 def test_encode_pitchwheel():
     assert 'E0 00 00' == Message('pitchwheel', pitch=MIN_PITCHWHEEL).hex()
     assert 'E0 00 40' == Message('pitchwheel', pitch=0).hex()
@@ -54,6 +69,20 @@ def test_sysex_data_accepts_different_types():
     assert Message('sysex', data=b'\x00\x01\x02').data == (0, 1, 2)
 
 
+def test_sysex_data_checks_buffers():
+    with raises(ValueError):
+        Message('sysex', data=b'\x80')
+
+    with raises(ValueError):
+        Message('sysex', data=bytearray(b'\x80'))
+
+    assert isinstance(Message('sysex', data=b'\x01').data, SysexData)
+
+
+def test_sysex_data_accepts_generator():
+    assert Message('sysex', data=(i for i in range(3))).data == (0, 1, 2)
+
+
 def test_copy():
     assert Message('start').copy(time=1) == Message('start', time=1)
 
@@ -92,6 +121,11 @@ def test_copy_handles_data_generator():
     assert isinstance(msg2.data, SysexData)
 
 
+def test_copy_checks_data():
+    with raises(ValueError):
+        Message('sysex').copy(data=[128])
+
+
 def test_compare_with_nonmessage():
     with raises(TypeError):
         assert Message('clock') == 'not a message'
@@ -119,3 +153,31 @@ def test_repr():
     msg = Message('note_on', channel=1, note=2, time=3)
     msg_eval = eval(repr(msg))  # noqa: S307
     assert msg == msg_eval
+
+
+def test_bin():
+    assert Message('note_on', note=60).bin() == bytearray(b'\x90\x3c\x40')
+    assert Message('sysex', data=(1, 2, 3)).bin() == \
+        bytearray(b'\xf0\x01\x02\x03\xf7')
+    assert Message('sysex').bin() == bytearray(b'\xf0\xf7')
+
+
+def test_parse_string_stream():
+    lines = [
+        '# A comment # with a hash in it\n',
+        '\n',
+        'note_on channel=1 note=60  # A trailing comment\n',
+        'note_on zzzzzzzzzzzz=2\n',
+    ]
+    results = list(parse_string_stream(lines))
+    assert results[0] == (Message('note_on', channel=1, note=60), None)
+    msg, error = results[1]
+    assert msg is None
+    assert error.startswith('line 4: ')
+    assert len(results) == 2
+
+
+def test_hex_sep():
+    assert Message('note_on').hex() == '90 00 40'
+    assert Message('note_on').hex(sep='') == '900040'
+    assert Message('note_on').hex(sep=', ') == '90, 00, 40'
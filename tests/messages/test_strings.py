@@ -21,3 +21,20 @@ def test_encode_sysex():
     # This should not have an extra comma.
     assert str(Message('sysex', data=(1,))) == 'sysex data=(1) time=0'
     assert str(Message('sysex', data=(1, 2, 3))) == 'sysex data=(1,2,3) time=0'
+
+
+def test_decode_empty_sysex():
+    assert Message.from_str('sysex data=() time=0').data == ()
+
+
+def test_decode_multiline():
+    msg = Message.from_str('note_on\n  channel=1\n  note=60\n')
+    assert msg == Message('note_on', channel=1, note=60)
+
+
+def test_decode_invalid_argument():
+    with raises(ValueError):
+        Message.from_str('note_on note')
+
+    with raises(ValueError):
+        Message.from_str('note_on note=60 =1')
@@ -9,9 +9,24 @@ from mido.midifiles.meta import (
     MetaMessage,
     MetaSpec_key_signature,
     UnknownMetaMessage,
+    encode_variable_int,
 )
 
 
+@pytest.mark.parametrize('value,expected', [(0, [0]),
+                                            (0x7f, [0x7f]),
+                                            (0x80, [0x81, 0x00]),
+                                            (0x3fff, [0xff, 0x7f]),
+                                            (0x4000, [0x81, 0x80, 0x00])])
+def test_encode_variable_int(value, expected):
+    assert encode_variable_int(value) == expected
+
+
+def test_encode_variable_int_negative():
+    with pytest.raises(ValueError):
+        encode_variable_int(-1)
+
+
 def test_copy_invalid_argument():
     with pytest.raises(ValueError):
         MetaMessage('track_name').copy(a=1)
@@ -95,3 +110,10 @@ def test_meta_from_bytes_text():
     msg = MetaMessage.from_bytes(test_bytes)
     assert msg.type == 'text'
     assert msg.text == 'TEST'
+
+
+def test_value_names_are_not_shared_mutable_state():
+    names = MetaMessage('set_tempo')._get_value_names()
+    assert names == ('tempo', 'time')
+    with pytest.raises(AttributeError):
+        names.append('zzz')
@@ -81,6 +81,37 @@ def test_eof_in_track():
         """)
 
 
+def test_eof_in_sysex():
+    with raises(EOFError):
+        read_file(HEADER_ONE_TRACK + """
+        4d 54 72 6b  # MTrk
+        00 00 00 06  # Chunk size
+        00 f0 04 01 02  # sysex with 4 bytes but only 2 present
+        """)
+
+
+def test_sysex_data_is_read():
+    midi_file = read_file(HEADER_ONE_TRACK + """
+    4d 54 72 6b  # MTrk
+    00 00 00 06  # Chunk size
+    00 f0 03 01 02 f7  # sysex data=(1,2)
+    """)
+    assert midi_file.tracks[0][0] == Message('sysex', data=(1, 2))
+
+
+def test_debug_prints_position_of_each_byte(capsys):
+    MidiFile(file=io.BytesIO(parse_hexdump(HEADER_ONE_TRACK + """
+    4d 54 72 6b  # MTrk
+    00 00 00 04
+    20 90 40 40  # note_on
+    """)), debug=True)
+
+    positions = [int(line.split(':')[0], 16)
+                 for line in capsys.readouterr().out.splitlines()
+                 if line.startswith('  0')]
+    assert positions == list(range(1, len(positions) + 1))
+
+
 def test_invalid_data_byte_no_clipping():
     # TODO: should this raise IOError?
     with raises(IOError):
@@ -23,6 +23,14 @@ def test_hashability():
     hash(FrozenUnknownMetaMessage(123, [1, 2, 3]))
 
 
+def test_equal_messages_have_equal_hashes():
+    # Decoded messages have their attributes in a different order.
+    msg1 = freeze_message(Message('note_on', channel=1, note=2))
+    msg2 = freeze_message(Message.from_bytes([0x91, 2, 64]))
+    assert msg1 == msg2
+    assert hash(msg1) == hash(msg2)
+
+
 def test_freeze_and_thaw():
     """Test that messages are hashable."""
     assert not is_frozen(thaw_message(freeze_message(Message('note_on'))))